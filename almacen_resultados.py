@@ -0,0 +1,343 @@
+"""
+Almacén persistente de resultados de compensación (SQLite en modo WAL).
+
+Permite que todos los workers de la API compartan los resultados de
+`compensacion_base10_suma` entre procesos y reinicios, sin necesidad de
+ningún servicio externo.
+
+Uso desde línea de comandos:
+    python almacen_resultados.py precalentar resultados.db --hasta 200
+    python almacen_resultados.py podar resultados.db --ttl 86400
+"""
+
+import argparse
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Optional
+
+from suma_algoritmos import compensacion_base10_suma
+
+NIVELES = ('auto', 'decena', 'centena', 'unidad_de_millar')
+
+# Tamaño de lote por defecto para inserciones masivas
+TAMANO_LOTE = 500
+
+# Conexiones por proceso y segundos mínimos entre podas automáticas
+TAMANO_POOL = 4
+INTERVALO_PODA = 60.0
+
+# Rango de un INTEGER de SQLite; fuera de él sqlite3 lanza OverflowError
+SQLITE_MIN_ENTERO = -2 ** 63
+SQLITE_MAX_ENTERO = 2 ** 63 - 1
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS resultados (
+    a INTEGER NOT NULL,
+    b INTEGER NOT NULL,
+    nivel TEXT NOT NULL,
+    resultado TEXT NOT NULL,
+    creado REAL NOT NULL,
+    PRIMARY KEY (a, b, nivel)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_resultados_creado ON resultados (creado);
+"""
+
+
+class AlmacenResultados:
+    """
+    Caché persistente de resultados indexada por (a, b, nivel).
+
+    Cada proceso (worker) mantiene un pool acotado de `tamano_pool`
+    conexiones a SQLite: los hilos toman una conexión, la usan y la
+    devuelven. Si el proceso se bifurca (servidores pre-fork), el hijo
+    crea su propio pool en lugar de reutilizar las conexiones del padre.
+
+    Si hay `ttl` o `max_entradas`, las escrituras podan el almacén como
+    mucho una vez cada `intervalo_poda` segundos.
+
+    Args:
+        ruta: Ruta al fichero SQLite
+        ttl: Segundos de vida de cada entrada (None = sin caducidad)
+        max_entradas: Número máximo de filas tras una poda
+                      (None = sin límite)
+        tamano_pool: Conexiones máximas por proceso
+        intervalo_poda: Segundos mínimos entre podas automáticas
+    """
+
+    def __init__(self, ruta: str, ttl: Optional[float] = None,
+                 max_entradas: Optional[int] = None,
+                 tamano_pool: int = TAMANO_POOL,
+                 intervalo_poda: float = INTERVALO_PODA):
+        self.ruta = ruta
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self.tamano_pool = tamano_pool
+        self.intervalo_poda = intervalo_poda
+        self._pid = None
+        self._cerrojo_pool = threading.Lock()
+        self._ultima_poda = time.monotonic()
+
+        with self._conexion() as con:
+            con.executescript(_ESQUEMA)
+
+    def _preparar_pool(self) -> None:
+        """Crea el pool del proceso actual si aún no existe."""
+        if self._pid == os.getpid():
+            return
+        with self._cerrojo_pool:
+            # Otro hilo pudo crear el pool mientras esperábamos el cerrojo
+            if self._pid == os.getpid():
+                return
+            # Tras un fork, las conexiones heredadas se descartan sin
+            # cerrarlas (pertenecen al padre)
+            self._libres = queue.Queue()
+            self._todas = []
+            self._cerrojo = threading.Lock()
+            self._pid = os.getpid()
+
+    def _nueva_conexion(self) -> sqlite3.Connection:
+        con = sqlite3.connect(self.ruta, timeout=30,
+                              check_same_thread=False)
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        return con
+
+    @contextmanager
+    def _conexion(self):
+        """Toma una conexión del pool del proceso y la devuelve al salir."""
+        self._preparar_pool()
+        libres = self._libres
+
+        try:
+            con = libres.get_nowait()
+        except queue.Empty:
+            with self._cerrojo:
+                crear = len(self._todas) < self.tamano_pool
+                if crear:
+                    con = self._nueva_conexion()
+                    self._todas.append(con)
+            if not crear:
+                con = libres.get()
+
+        try:
+            yield con
+        finally:
+            libres.put(con)
+
+    def obtener(self, a: int, b: int, nivel: str) -> Optional[dict]:
+        """
+        Busca un resultado guardado.
+
+        Returns:
+            El dict del resultado, o None si no existe o ha caducado
+        """
+        with self._conexion() as con:
+            fila = con.execute(
+                "SELECT resultado, creado FROM resultados "
+                "WHERE a = ? AND b = ? AND nivel = ?",
+                (a, b, nivel)
+            ).fetchone()
+
+        if fila is None:
+            return None
+        if self.ttl is not None and time.time() - fila[1] > self.ttl:
+            return None
+        return json.loads(fila[0])
+
+    def guardar(self, a: int, b: int, nivel: str, resultado: dict) -> None:
+        """Guarda (o reemplaza) un único resultado."""
+        self.guardar_lote([(a, b, nivel, resultado)])
+
+    def guardar_lote(self, filas: Iterable[tuple],
+                     tamano_lote: int = TAMANO_LOTE) -> int:
+        """
+        Inserta resultados en bloque, en transacciones de `tamano_lote`.
+
+        Args:
+            filas: Iterable de tuplas (a, b, nivel, resultado)
+            tamano_lote: Número de filas por transacción
+
+        Returns:
+            Número total de filas insertadas
+        """
+        total = 0
+        lote = []
+
+        with self._conexion() as con:
+            def volcar():
+                with con:
+                    con.executemany(
+                        "INSERT OR REPLACE INTO resultados "
+                        "(a, b, nivel, resultado, creado) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        lote
+                    )
+
+            ahora = time.time()
+            for a, b, nivel, resultado in filas:
+                lote.append((a, b, nivel,
+                             json.dumps(resultado, ensure_ascii=False),
+                             ahora))
+                if len(lote) >= tamano_lote:
+                    volcar()
+                    total += len(lote)
+                    lote = []
+
+            if lote:
+                volcar()
+                total += len(lote)
+
+        self._podar_si_toca()
+        return total
+
+    def _podar_si_toca(self) -> None:
+        """Poda si hay límites y ha pasado `intervalo_poda` desde la última."""
+        if self.ttl is None and self.max_entradas is None:
+            return
+        if time.monotonic() - self._ultima_poda < self.intervalo_poda:
+            return
+        self._ultima_poda = time.monotonic()
+        self.podar()
+
+    def podar(self) -> int:
+        """
+        Elimina entradas caducadas (por TTL) y las más antiguas si se
+        supera `max_entradas`.
+
+        Returns:
+            Número de filas eliminadas
+        """
+        eliminadas = 0
+
+        with self._conexion() as con, con:
+            if self.ttl is not None:
+                cur = con.execute(
+                    "DELETE FROM resultados WHERE creado < ?",
+                    (time.time() - self.ttl,)
+                )
+                eliminadas += cur.rowcount
+
+            if self.max_entradas is not None:
+                cur = con.execute(
+                    "DELETE FROM resultados WHERE (a, b, nivel) IN ("
+                    "  SELECT a, b, nivel FROM resultados"
+                    "  ORDER BY creado DESC LIMIT -1 OFFSET ?"
+                    ")",
+                    (self.max_entradas,)
+                )
+                eliminadas += cur.rowcount
+
+        return eliminadas
+
+    def total(self) -> int:
+        """Número de entradas guardadas."""
+        with self._conexion() as con:
+            return con.execute(
+                "SELECT COUNT(*) FROM resultados"
+            ).fetchone()[0]
+
+    def conexiones_abiertas(self) -> int:
+        """Conexiones creadas por el pool del proceso actual."""
+        self._preparar_pool()
+        return len(self._todas)
+
+    def cerrar(self) -> None:
+        """Cierra todas las conexiones abiertas por este proceso."""
+        self._preparar_pool()
+        with self._cerrojo:
+            for con in self._todas:
+                con.close()
+        self._pid = None
+
+
+def _cabe_en_sqlite(valor: int) -> bool:
+    """Indica si un entero cabe en un INTEGER de SQLite (64 bits)."""
+    return SQLITE_MIN_ENTERO <= valor <= SQLITE_MAX_ENTERO
+
+
+def compensacion_con_almacen(almacen: Optional[AlmacenResultados],
+                             a: int, b: int, nivel: str = "auto") -> dict:
+    """
+    Igual que `compensacion_base10_suma`, pero consultando antes el almacén
+    y guardando en él los resultados nuevos.
+
+    Si `almacen` es None, o algún operando no cabe en un INTEGER de
+    SQLite (64 bits), se calcula directamente sin usar el almacén.
+    """
+    if almacen is None or not (_cabe_en_sqlite(a) and _cabe_en_sqlite(b)):
+        return compensacion_base10_suma(a, b, nivel)
+
+    resultado = almacen.obtener(a, b, nivel)
+    if resultado is None:
+        resultado = compensacion_base10_suma(a, b, nivel)
+        almacen.guardar(a, b, nivel, resultado)
+    return resultado
+
+
+def precalentar(almacen: AlmacenResultados, desde: int, hasta: int,
+                niveles: Iterable[str] = NIVELES,
+                tamano_lote: int = TAMANO_LOTE) -> int:
+    """
+    Precarga en el almacén todas las sumas a + b con a, b en [desde, hasta].
+
+    Returns:
+        Número de resultados insertados
+    """
+    niveles = tuple(niveles)
+
+    def generar():
+        for a in range(desde, hasta + 1):
+            for b in range(desde, hasta + 1):
+                for nivel in niveles:
+                    yield a, b, nivel, compensacion_base10_suma(a, b, nivel)
+
+    return almacen.guardar_lote(generar(), tamano_lote=tamano_lote)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Gestión del almacén persistente de resultados."
+    )
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_pre = sub.add_parser("precalentar",
+                           help="Precarga rangos de operandos comunes")
+    p_pre.add_argument("ruta", help="Fichero SQLite")
+    p_pre.add_argument("--desde", type=int, default=1)
+    p_pre.add_argument("--hasta", type=int, default=100)
+    p_pre.add_argument("--niveles", nargs="+", choices=NIVELES,
+                       default=list(NIVELES))
+    p_pre.add_argument("--lote", type=int, default=TAMANO_LOTE)
+
+    p_podar = sub.add_parser("podar",
+                             help="Elimina entradas caducadas o sobrantes")
+    p_podar.add_argument("ruta", help="Fichero SQLite")
+    p_podar.add_argument("--ttl", type=float, default=None)
+    p_podar.add_argument("--max-entradas", type=int, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.comando == "precalentar":
+        almacen = AlmacenResultados(args.ruta)
+        inicio = time.perf_counter()
+        total = precalentar(almacen, args.desde, args.hasta,
+                            args.niveles, args.lote)
+        duracion = time.perf_counter() - inicio
+        print(f"✅ {total} resultados precargados en {duracion:.2f}s")
+    else:
+        almacen = AlmacenResultados(args.ruta, ttl=args.ttl,
+                                    max_entradas=args.max_entradas)
+        eliminadas = almacen.podar()
+        print(f"🧹 {eliminadas} entradas eliminadas "
+              f"({almacen.total()} restantes)")
+
+    almacen.cerrar()
+
+
+if __name__ == "__main__":
+    main()
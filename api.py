@@ -3,12 +3,47 @@ API Flask para estrategias de cálculo mental.
 Expone endpoints REST para que el frontend React consuma la lógica de Python.
 """
 
+import os
+
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from suma_algoritmos import compensacion_base10_suma
+from coalescencia import Coalescedor
 
 app = Flask(__name__)
 
+# Almacén persistente opcional (SQLite WAL) compartido entre workers.
+# Se activa definiendo COMPENSACION_DB con la ruta del fichero; solo
+# entonces se importa el módulo (y sqlite3), para no penalizar el arranque.
+almacen = None
+calcular_compensacion = compensacion_base10_suma
+
+if os.environ.get('COMPENSACION_DB'):
+    from almacen_resultados import (
+        AlmacenResultados, compensacion_con_almacen
+    )
+
+    almacen = AlmacenResultados(
+        os.environ['COMPENSACION_DB'],
+        ttl=float(os.environ['COMPENSACION_DB_TTL'])
+        if os.environ.get('COMPENSACION_DB_TTL') else None,
+        max_entradas=int(os.environ['COMPENSACION_DB_MAX'])
+        if os.environ.get('COMPENSACION_DB_MAX') else None
+    )
+
+    def calcular_compensacion(a, b, nivel="auto"):
+        return compensacion_con_almacen(almacen, a, b, nivel)
+
+# Registro opcional de tráfico para reproducirlo después.
+# Se activa definiendo REGISTRO_TRAFICO con la ruta del fichero de log.
+if os.environ.get('REGISTRO_TRAFICO'):
+    from registro_trafico import RegistradorTrafico
+
+    RegistradorTrafico(os.environ['REGISTRO_TRAFICO']).instalar(app)
+
+# Peticiones idénticas concurrentes comparten un único cálculo y cuerpo JSON
+coalescedor = Coalescedor()
+
 # Habilitar CORS para permitir peticiones desde React y HTML local
 CORS(app, resources={
     r"/api/*": {
@@ -125,10 +160,16 @@ def compensacion_suma_endpoint(operacion):
                     f"El nivel debe ser uno de: {', '.join(niveles_validos)}"
             }), 400
 
-        # Ejecutar la función de compensación
-        resultado = compensacion_base10_suma(a, b, nivel)
+        # Ejecutar la función de compensación (una sola vez por ráfaga
+        # de peticiones idénticas) y serializar el cuerpo compartido
+        def calcular_cuerpo():
+            resultado = calcular_compensacion(a, b, nivel)
+            return jsonify(resultado).get_data()
 
-        return jsonify(resultado), 200
+        cuerpo = coalescedor.ejecutar((request.path, nivel), calcular_cuerpo)
+
+        return app.response_class(cuerpo, status=200,
+                                  mimetype='application/json')
 
     except ValueError as e:
         return jsonify({
@@ -143,6 +184,17 @@ def compensacion_suma_endpoint(operacion):
         }), 500
 
 
+@app.route('/api/metricas/coalescencia', methods=['GET'])
+def metricas_coalescencia():
+    """
+    Devuelve cuántas peticiones se han coalescido.
+
+    Returns:
+        JSON con ejecuciones, coalescidas y cálculos en vuelo
+    """
+    return jsonify(coalescedor.metricas()), 200
+
+
 @app.route('/api/suma/compensacion_base10/ejemplos', methods=['GET'])
 def obtener_ejemplos():
     """
@@ -213,6 +265,7 @@ if __name__ == '__main__':
           "compensacion_base10/79+25?nivel=decena")
     print("   - GET  http://localhost:5000/api/suma/"
           "compensacion_base10/ejemplos")
+    print("   - GET  http://localhost:5000/api/metricas/coalescencia")
     print("\n💡 Presiona Ctrl+C para detener el servidor\n")
 
     # Modo debug para desarrollo (auto-reload)
@@ -0,0 +1,91 @@
+"""
+Punto de entrada ligero para trabajos CLI cortos y workers serverless.
+
+Importar este módulo no carga Flask, flask_cors ni aceleradores opcionales:
+    - `compensar()` es la ruta de librería pura (solo `suma_algoritmos`).
+    - `aplicacion` es un callable WSGI que construye la app Flask de
+      `api.py` (con su configuración CORS) en la primera petición.
+    - `serializar()` usa orjson si está instalado, importándolo al primer uso.
+      Solo lo usa la CLI: las respuestas WSGI siguen serializándose con
+      `jsonify` de Flask.
+
+Uso:
+    python arranque_rapido.py 79+25 --nivel decena
+    gunicorn arranque_rapido:aplicacion
+"""
+
+import threading
+
+from suma_algoritmos import compensacion_base10_suma
+
+_cerrojo = threading.Lock()
+_app = None
+_dumps = None
+
+
+def compensar(a: int, b: int, nivel: str = "auto") -> dict:
+    """Calcula la compensación en base 10 sin dependencias web."""
+    return compensacion_base10_suma(a, b, nivel)
+
+
+def serializar(datos) -> bytes:
+    """
+    Serializa a JSON (UTF-8), con orjson si está disponible.
+
+    El acelerador se busca una sola vez, en la primera llamada.
+    """
+    global _dumps
+    if _dumps is None:
+        try:
+            import orjson
+            _dumps = orjson.dumps
+        except ImportError:
+            import json
+
+            def _dumps(obj):
+                return json.dumps(obj, ensure_ascii=False,
+                                  separators=(",", ":")).encode("utf-8")
+    return _dumps(datos)
+
+
+def obtener_app():
+    """Importa `api` y devuelve la app Flask, solo la primera vez."""
+    global _app
+    if _app is None:
+        with _cerrojo:
+            if _app is None:
+                from api import app
+                _app = app
+    return _app
+
+
+def aplicacion(environ, start_response):
+    """Callable WSGI que difiere la construcción de la app Flask."""
+    return obtener_app()(environ, start_response)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compensación en base 10 desde línea de comandos."
+    )
+    parser.add_argument("operacion", help="Suma en formato a+b (ej: 79+25)")
+    parser.add_argument("--nivel", default="auto",
+                        choices=["auto", "decena", "centena",
+                                 "unidad_de_millar"])
+    args = parser.parse_args(argv)
+
+    partes = args.operacion.split("+")
+    if len(partes) != 2:
+        parser.error("La operación debe tener formato 'a+b' (ej: 38+42)")
+    try:
+        a, b = int(partes[0].strip()), int(partes[1].strip())
+    except ValueError:
+        parser.error("Los sumandos deben ser números enteros válidos")
+
+    print(serializar(compensar(a, b, args.nivel)).decode("utf-8"))
+
+
+if __name__ == "__main__":
+    main()
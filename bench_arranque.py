@@ -0,0 +1,133 @@
+"""
+Benchmark de arranque en frío basado en `python -X importtime`.
+
+Importa cada módulo en un intérprete nuevo, mide el tiempo acumulado de
+importación (mejor de N ejecuciones) y lo compara con su presupuesto.
+También comprueba que las rutas ligeras no cargan dependencias web.
+Termina con código 1 si algún módulo se pasa de presupuesto o no se puede
+importar (usa --omitir para excluir un módulo de forma explícita).
+
+Uso:
+    python bench_arranque.py
+    python bench_arranque.py --repeticiones 10 --presupuesto api=400
+    python bench_arranque.py --omitir api
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Presupuestos por defecto, en milisegundos de importación acumulada
+PRESUPUESTOS = {
+    "suma_algoritmos": 30.0,
+    "arranque_rapido": 40.0,
+    "api": 500.0,
+}
+
+# Módulos que no deben cargarse al importar cada ruta ligera
+PROHIBIDOS = {
+    "suma_algoritmos": ("flask", "flask_cors", "numpy", "orjson"),
+    "arranque_rapido": ("flask", "flask_cors", "numpy", "orjson"),
+}
+
+_DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+
+def medir_importacion(modulo: str) -> tuple:
+    """
+    Importa `modulo` en un intérprete nuevo con `-X importtime`.
+
+    Returns:
+        (tiempo acumulado en ms, conjunto de módulos cargados)
+    """
+    codigo = (
+        f"import sys; import {modulo}; "
+        "print('\\n'.join(sorted(sys.modules)))"
+    )
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=_DIRECTORIO, capture_output=True, text=True, check=True
+    )
+
+    # Formato: "import time: self [us] | cumulative | imported package"
+    # El módulo de primer nivel aparece sin sangría en la última columna.
+    acumulado_us = None
+    for linea in proceso.stderr.splitlines():
+        columnas = linea.split("|")
+        if len(columnas) == 3 and columnas[2][1:] == modulo:
+            acumulado_us = int(columnas[1])
+
+    if acumulado_us is None:
+        raise RuntimeError(f"No se encontró '{modulo}' en la salida")
+
+    return acumulado_us / 1000, set(proceso.stdout.split())
+
+
+def _presupuesto(valor: str) -> tuple:
+    """Convierte "MODULO=MS" en (modulo, ms) para argparse."""
+    modulo, _, ms = valor.partition("=")
+    try:
+        return modulo, float(ms)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"'{valor}' no tiene formato MODULO=MS (ej: api=400)"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Mide el tiempo de importación frente a un presupuesto."
+    )
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--presupuesto", action="append", default=[],
+                        type=_presupuesto, metavar="MODULO=MS",
+                        help="Sobrescribe el presupuesto de un módulo")
+    parser.add_argument("--omitir", action="append", default=[],
+                        metavar="MODULO",
+                        help="No mide este módulo (p. ej. sin Flask)")
+    args = parser.parse_args(argv)
+
+    presupuestos = dict(PRESUPUESTOS)
+    presupuestos.update(args.presupuesto)
+    for modulo in args.omitir:
+        presupuestos.pop(modulo, None)
+
+    fallos = []
+    print(f"{'Módulo':<20} {'Mejor ms':>9} {'Presupuesto':>12}  Estado")
+
+    for modulo, presupuesto in presupuestos.items():
+        try:
+            mediciones = [medir_importacion(modulo)
+                          for _ in range(args.repeticiones)]
+        except subprocess.CalledProcessError as e:
+            error = e.stderr.strip().splitlines()[-1]
+            print(f"{modulo:<20} {'-':>9} {presupuesto:>12.1f}  "
+                  f"❌ no importable ({error})")
+            fallos.append(modulo)
+            continue
+
+        mejor = min(ms for ms, _ in mediciones)
+        cargados = mediciones[0][1]
+        prohibidos = [m for m in PROHIBIDOS.get(modulo, ())
+                      if m in cargados]
+
+        estado = "✅"
+        if mejor > presupuesto:
+            estado = "❌ fuera de presupuesto"
+            fallos.append(modulo)
+        if prohibidos:
+            estado = f"❌ carga {', '.join(prohibidos)}"
+            fallos.append(modulo)
+
+        print(f"{modulo:<20} {mejor:>9.2f} {presupuesto:>12.1f}  {estado}")
+
+    if fallos:
+        print(f"\n❌ Regresión de arranque en: {', '.join(fallos)}")
+        sys.exit(1)
+
+    print("\n✅ Arranque dentro de presupuesto")
+
+
+if __name__ == "__main__":
+    main()
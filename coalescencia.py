@@ -0,0 +1,109 @@
+"""
+Coalescencia de peticiones idénticas concurrentes ("single-flight").
+
+Cuando varias peticiones con la misma clave llegan a la vez, solo la
+primera ejecuta el cálculo; el resto espera y reutiliza su resultado.
+"""
+
+import copy
+import threading
+
+
+class ErrorCalculoCompartido(Exception):
+    """
+    Error que reciben las llamadas en espera cuando el cálculo compartido
+    falla y su excepción no puede copiarse, o cuando se interrumpe
+    (KeyboardInterrupt, SystemExit...).
+    """
+
+
+class _Vuelo:
+    """Cálculo en curso para una clave."""
+
+    def __init__(self):
+        self.evento = threading.Event()
+        self.resultado = None
+        self.error = None
+        self.completado = False
+
+
+class Coalescedor:
+    """
+    Comparte un único cálculo entre llamadas concurrentes con la misma clave.
+
+    Métricas disponibles en `metricas()`:
+        - ejecuciones: cálculos realmente ejecutados
+        - coalescidas: llamadas que reutilizaron un cálculo en curso
+        - en_vuelo: cálculos en curso en este momento
+    """
+
+    def __init__(self):
+        self._cerrojo = threading.Lock()
+        self._en_vuelo = {}
+        self._ejecuciones = 0
+        self._coalescidas = 0
+
+    def ejecutar(self, clave, funcion):
+        """
+        Ejecuta `funcion()` o espera al cálculo en curso con la misma clave.
+
+        Si el cálculo compartido lanza una excepción, todas las llamadas
+        que lo esperaban lanzan una copia (encadenada a la original), o
+        `ErrorCalculoCompartido` si no puede copiarse o el líder fue
+        interrumpido.
+
+        Args:
+            clave: Identificador hashable del cálculo
+            funcion: Callable sin argumentos que produce el resultado
+
+        Returns:
+            El resultado de `funcion()`
+        """
+        with self._cerrojo:
+            vuelo = self._en_vuelo.get(clave)
+            if vuelo is None:
+                vuelo = self._en_vuelo[clave] = _Vuelo()
+                lider = True
+                self._ejecuciones += 1
+            else:
+                lider = False
+                self._coalescidas += 1
+
+        if lider:
+            try:
+                vuelo.resultado = funcion()
+                vuelo.completado = True
+            except Exception as e:
+                vuelo.error = e
+                raise
+            finally:
+                if not vuelo.completado and vuelo.error is None:
+                    # Interrupción del líder: no se propaga a los demás
+                    vuelo.error = ErrorCalculoCompartido(
+                        "El cálculo compartido se interrumpió"
+                    )
+                with self._cerrojo:
+                    del self._en_vuelo[clave]
+                vuelo.evento.set()
+            return vuelo.resultado
+
+        vuelo.evento.wait()
+        if vuelo.error is not None:
+            # Cada llamada lanza su propia copia: compartir la instancia
+            # mezclaría los tracebacks de hilos distintos
+            try:
+                error = copy.copy(vuelo.error).with_traceback(None)
+            except Exception:
+                # Excepciones cuyo constructor no acepta sus propios args
+                error = ErrorCalculoCompartido(str(vuelo.error))
+            raise error from vuelo.error
+        return vuelo.resultado
+
+    def metricas(self) -> dict:
+        """Devuelve un resumen de los contadores."""
+        with self._cerrojo:
+            return {
+                "ejecuciones": self._ejecuciones,
+                "coalescidas": self._coalescidas,
+                "en_vuelo": len(self._en_vuelo)
+            }
@@ -0,0 +1,109 @@
+"""
+Registro opcional del tráfico real de la API.
+
+Cada petición se añade como una línea JSON compacta a un fichero de log
+rotativo, para poder reproducirla después con `reproducir_trafico.py`.
+
+`RotatingFileHandler` no es seguro entre procesos, así que cada worker
+escribe en su propio fichero `<ruta>.<pid>` (rotado como `<ruta>.<pid>.1`,
+`<ruta>.<pid>.2`...). `reproducir_trafico.py` los lee todos.
+
+Formato de cada registro:
+    {"t": 1700000000.123, "r": "/api/suma/compensacion_base10/<operacion>",
+     "op": "79+25", "n": "decena", "ms": 0.42, "s": 200}
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+from flask import g, request
+
+
+class RegistradorTrafico:
+    """
+    Escribe un registro por petición en un fichero rotativo por proceso.
+
+    El fichero se abre en la primera petición de cada proceso, de modo que
+    los workers creados por fork no comparten el del padre.
+
+    Args:
+        ruta: Prefijo del fichero de log (se añade `.<pid>`)
+        max_bytes: Tamaño máximo antes de rotar
+        copias: Número de ficheros rotados que se conservan
+    """
+
+    def __init__(self, ruta: str, max_bytes: int = 10 * 1024 * 1024,
+                 copias: int = 5):
+        self.ruta = ruta
+        self.max_bytes = max_bytes
+        self.copias = copias
+        self._pid = None
+        self._logger = None
+        self._cerrojo = threading.Lock()
+
+    def _logger_proceso(self) -> logging.Logger:
+        """Devuelve el logger del proceso actual, creándolo si falta."""
+        if self._pid == os.getpid():
+            return self._logger
+
+        with self._cerrojo:
+            ruta = f"{self.ruta}.{os.getpid()}"
+            logger = logging.getLogger(f"registro_trafico.{ruta}")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+            if not logger.handlers:
+                handler = RotatingFileHandler(
+                    ruta, maxBytes=self.max_bytes, backupCount=self.copias,
+                    encoding="utf-8"
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                logger.addHandler(handler)
+
+            self._logger = logger
+            self._pid = os.getpid()
+        return logger
+
+    def registrar(self, ruta: str, operacion, nivel, inicio: float,
+                  latencia_ms: float, status: int) -> None:
+        """Añade un registro al fichero del proceso actual."""
+        self._logger_proceso().info(json.dumps({
+            "t": round(inicio, 6),
+            "r": ruta,
+            "op": operacion,
+            "n": nivel,
+            "ms": round(latencia_ms, 3),
+            "s": status
+        }, separators=(",", ":"), ensure_ascii=False))
+
+    def instalar(self, app) -> None:
+        """Registra los hooks before/after request en la app Flask."""
+
+        @app.before_request
+        def _iniciar_cronometro():
+            g.registro_inicio = time.time()
+            g.registro_perf = time.perf_counter()
+
+        @app.after_request
+        def _registrar_peticion(response):
+            inicio = getattr(g, "registro_inicio", None)
+            if inicio is None:
+                return response
+
+            latencia_ms = (time.perf_counter() - g.registro_perf) * 1000
+            regla = request.url_rule
+            view_args = request.view_args or {}
+
+            self.registrar(
+                regla.rule if regla is not None else request.path,
+                view_args.get("operacion"),
+                request.args.get("nivel"),
+                inicio,
+                latencia_ms,
+                response.status_code
+            )
+            return response
@@ -0,0 +1,240 @@
+"""
+Reproduce tráfico grabado por `registro_trafico.py` para planificar capacidad.
+
+Respeta los intervalos originales entre peticiones, acelerados por el
+factor indicado (1x, 10x, 100x...), y muestra por ruta el throughput,
+los percentiles de latencia y la tasa de errores.
+
+Uso:
+    # Contra la app en proceso (cliente de pruebas de Flask)
+    python reproducir_trafico.py trafico.log --velocidad 10
+
+    # Contra un servidor HTTP local
+    python reproducir_trafico.py trafico.log --velocidad 100 \\
+        --url http://localhost:5000
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlencode
+
+# Retraso p99 sobre el calendario a partir del cual se avisa en el informe
+UMBRAL_RETRASO_MS = 100.0
+
+
+def ficheros_de_log(ruta: str) -> list:
+    """
+    Devuelve los ficheros de un log: el propio `ruta` si existe, los de
+    cada proceso (ruta.<pid>) y sus copias rotadas (ruta.<pid>.1, ...).
+    """
+    sufijo = re.compile(r"\.\d+(\.\d+)?$")
+    ficheros = [ruta] if os.path.exists(ruta) else []
+    for fichero in glob.glob(f"{glob.escape(ruta)}.*"):
+        if sufijo.fullmatch(fichero[len(ruta):]):
+            ficheros.append(fichero)
+    return sorted(ficheros)
+
+
+def cargar_registros(ruta: str) -> list:
+    """
+    Lee todos los ficheros del log (ver `ficheros_de_log`).
+
+    Returns:
+        Lista de registros ordenados por marca de tiempo
+    """
+    registros = []
+    for fichero in ficheros_de_log(ruta):
+        with open(fichero, encoding="utf-8") as f:
+            for linea in f:
+                linea = linea.strip()
+                if linea:
+                    registros.append(json.loads(linea))
+
+    registros.sort(key=lambda r: r["t"])
+    return registros
+
+
+def construir_url(registro: dict) -> str:
+    """Reconstruye la ruta (con query string) de un registro."""
+    url = registro["r"]
+    if registro.get("op") is not None:
+        url = url.replace("<operacion>", quote(registro["op"], safe="+"))
+    if registro.get("n") is not None:
+        url += "?" + urlencode({"nivel": registro["n"]})
+    return url
+
+
+def _peticion_cliente_flask():
+    """
+    Devuelve una función que ejecuta peticiones con el test client.
+
+    Se desactiva REGISTRO_TRAFICO antes de importar `api`: si siguiera
+    activo, la reproducción se añadiría al mismo log que se reproduce.
+    """
+    os.environ.pop("REGISTRO_TRAFICO", None)
+    from api import app
+
+    local = threading.local()
+
+    def ejecutar(url):
+        cliente = getattr(local, "cliente", None)
+        if cliente is None:
+            cliente = local.cliente = app.test_client()
+        return cliente.get(url).status_code
+
+    return ejecutar
+
+
+def _peticion_http(base_url: str):
+    """Devuelve una función que ejecuta peticiones HTTP reales."""
+    base_url = base_url.rstrip("/")
+
+    def ejecutar(url):
+        try:
+            with urllib.request.urlopen(base_url + url, timeout=30) as resp:
+                resp.read()
+                return resp.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    return ejecutar
+
+
+def percentil(valores: list, p: float) -> float:
+    """Percentil p (0-100) por el método del rango más cercano."""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = max(0, min(len(ordenados) - 1,
+                        math.ceil(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+
+def reproducir(registros: list, ejecutar, velocidad: float = 1.0,
+               hilos: int = 32) -> dict:
+    """
+    Lanza las peticiones respetando los intervalos originales / velocidad.
+
+    La latencia se mide desde el instante en que cada petición debía
+    enviarse según el calendario, no desde que un hilo la atiende: así el
+    tiempo de espera en cola cuando todos los hilos están ocupados aparece
+    en los percentiles (evita la "omisión coordinada").
+
+    Args:
+        registros: Registros ordenados por tiempo
+        ejecutar: Función url -> status HTTP
+        velocidad: Factor de aceleración
+        hilos: Peticiones concurrentes máximas
+
+    Returns:
+        Dict con la duración total, las mediciones por ruta y el retraso
+        (en ms) de cada envío real respecto a su instante programado
+    """
+    mediciones = defaultdict(lambda: {"latencias": [], "errores": 0})
+    retrasos = []
+    cerrojo = threading.Lock()
+
+    def lanzar(registro, programado):
+        retraso_ms = (time.perf_counter() - programado) * 1000
+        try:
+            status = ejecutar(construir_url(registro))
+        except Exception:
+            status = None
+        latencia_ms = (time.perf_counter() - programado) * 1000
+
+        with cerrojo:
+            retrasos.append(retraso_ms)
+            datos = mediciones[registro["r"]]
+            datos["latencias"].append(latencia_ms)
+            if status is None or status >= 500:
+                datos["errores"] += 1
+
+    if not registros:
+        return {"duracion": 0.0, "rutas": {}, "retrasos": []}
+
+    t0_grabado = registros[0]["t"]
+    t0 = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        for registro in registros:
+            programado = t0 + (registro["t"] - t0_grabado) / velocidad
+            espera = programado - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+            pool.submit(lanzar, registro, programado)
+
+    return {
+        "duracion": time.perf_counter() - t0,
+        "rutas": dict(mediciones),
+        "retrasos": retrasos
+    }
+
+
+def informe(resultado: dict) -> str:
+    """Genera un informe de texto por ruta y del retraso sobre calendario."""
+    duracion = resultado["duracion"] or 1e-9
+    lineas = [
+        f"{'Ruta':<45} {'Peticiones':>10} {'req/s':>9} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'Errores':>8}"
+    ]
+
+    for ruta, datos in sorted(resultado["rutas"].items()):
+        latencias = datos["latencias"]
+        total = len(latencias)
+        lineas.append(
+            f"{ruta:<45} {total:>10} {total / duracion:>9.1f} "
+            f"{percentil(latencias, 50):>8.2f} "
+            f"{percentil(latencias, 95):>8.2f} "
+            f"{percentil(latencias, 99):>8.2f} "
+            f"{datos['errores'] / total:>7.1%}"
+        )
+
+    retrasos = resultado.get("retrasos", [])
+    lineas.append(f"\nDuración total: {resultado['duracion']:.2f}s")
+    lineas.append(
+        f"Retraso sobre calendario: p50 {percentil(retrasos, 50):.2f} ms, "
+        f"p99 {percentil(retrasos, 99):.2f} ms, "
+        f"máx {max(retrasos, default=0.0):.2f} ms"
+    )
+    if percentil(retrasos, 99) > UMBRAL_RETRASO_MS:
+        lineas.append(
+            "⚠️  La reproducción no mantuvo el ritmo grabado: "
+            "aumenta --hilos o reduce --velocidad"
+        )
+    return "\n".join(lineas)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Reproduce tráfico grabado contra la API."
+    )
+    parser.add_argument("log", help="Fichero de tráfico grabado")
+    parser.add_argument("--velocidad", type=float, default=1.0,
+                        help="Factor de aceleración (1, 10, 100...)")
+    parser.add_argument("--url", default=None,
+                        help="Servidor HTTP (por defecto, test client)")
+    parser.add_argument("--hilos", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    registros = cargar_registros(args.log)
+    ejecutar = (_peticion_http(args.url) if args.url
+                else _peticion_cliente_flask())
+
+    print(f"🔁 Reproduciendo {len(registros)} peticiones "
+          f"a {args.velocidad:g}x...")
+    resultado = reproducir(registros, ejecutar, args.velocidad, args.hilos)
+    print(informe(resultado))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,3 @@
-import json
 from typing import Optional
 
 
@@ -252,6 +251,10 @@ def compensacion_base10_suma(a: int, b: int, nivel: str = "auto") -> dict:
 
 # Ejemplo de uso
 if __name__ == "__main__":
+    # json solo se necesita para los ejemplos; no se importa al usar la
+    # librería para no alargar el arranque
+    import json
+
     print("=" * 70)
     print("EJEMPLOS DE COMPENSACIÓN BASE 10 EN SUMA")
     print("=" * 70)
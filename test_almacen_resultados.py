@@ -0,0 +1,141 @@
+"""
+Script de prueba para el almacén persistente de resultados.
+Verifica lectura/escritura, inserción por lotes, poda y precalentado.
+"""
+
+import pathlib
+import tempfile
+import threading
+
+from almacen_resultados import (
+    AlmacenResultados, compensacion_con_almacen, precalentar
+)
+from suma_algoritmos import compensacion_base10_suma
+
+
+def _ruta_temporal(directorio):
+    """Devuelve la ruta del fichero SQLite dentro de `directorio`."""
+    return str(directorio / "resultados.db")
+
+
+def test_guardar_y_obtener(tmp_path):
+    """Un resultado guardado se recupera idéntico."""
+    almacen = AlmacenResultados(_ruta_temporal(tmp_path))
+    assert almacen.obtener(79, 25, "auto") is None
+
+    resultado = compensacion_con_almacen(almacen, 79, 25, "auto")
+    assert resultado == compensacion_base10_suma(79, 25, "auto")
+    assert almacen.obtener(79, 25, "auto") == resultado
+    almacen.cerrar()
+
+
+def test_persistencia_entre_instancias(tmp_path):
+    """Los resultados sobreviven a cerrar y reabrir el almacén."""
+    ruta = _ruta_temporal(tmp_path)
+    almacen = AlmacenResultados(ruta)
+    compensacion_con_almacen(almacen, 290, 603, "centena")
+    almacen.cerrar()
+
+    almacen = AlmacenResultados(ruta)
+    assert almacen.obtener(290, 603, "centena")["resultado_final"] == 893
+    almacen.cerrar()
+
+
+def test_precalentar_y_podar(tmp_path):
+    """El precalentado inserta por lotes y la poda respeta el máximo."""
+    almacen = AlmacenResultados(_ruta_temporal(tmp_path), max_entradas=10)
+    insertadas = precalentar(almacen, 1, 5, niveles=["auto"], tamano_lote=7)
+    assert insertadas == 25
+    assert almacen.total() == 25
+
+    assert almacen.podar() == 15
+    assert almacen.total() == 10
+    almacen.cerrar()
+
+
+def test_ttl(tmp_path):
+    """Con TTL negativo todas las entradas están caducadas."""
+    almacen = AlmacenResultados(_ruta_temporal(tmp_path), ttl=-1)
+    almacen.guardar(1, 2, "auto", compensacion_base10_suma(1, 2))
+    assert almacen.obtener(1, 2, "auto") is None
+    assert almacen.podar() == 1
+    almacen.cerrar()
+
+
+def test_pool_acotado_con_muchos_hilos(tmp_path):
+    """Hilos de vida corta reutilizan el pool en lugar de abrir conexiones."""
+    almacen = AlmacenResultados(_ruta_temporal(tmp_path), tamano_pool=4)
+
+    def peticion(i):
+        compensacion_con_almacen(almacen, i, 25, "auto")
+
+    for i in range(200):
+        hilo = threading.Thread(target=peticion, args=(i,))
+        hilo.start()
+        hilo.join()
+
+    assert almacen.conexiones_abiertas() <= 4
+    assert almacen.total() == 200
+    almacen.cerrar()
+
+
+def test_poda_automatica_al_escribir(tmp_path):
+    """Las escrituras aplican `max_entradas` sin ejecutar el CLI."""
+    almacen = AlmacenResultados(_ruta_temporal(tmp_path), max_entradas=5,
+                                intervalo_poda=0)
+    for i in range(200):
+        compensacion_con_almacen(almacen, i, 25, "auto")
+
+    assert almacen.total() <= 5
+    almacen.cerrar()
+
+
+def test_operandos_fuera_de_rango_sqlite(tmp_path):
+    """Operandos mayores de 64 bits se calculan sin pasar por el almacén."""
+    almacen = AlmacenResultados(_ruta_temporal(tmp_path))
+    for a, b in [(99999999999999999999, 1), (1, -2 ** 63 - 1)]:
+        resultado = compensacion_con_almacen(almacen, a, b, "auto")
+        assert resultado == compensacion_base10_suma(a, b, "auto")
+
+    # En el límite exacto sí se usa el almacén
+    compensacion_con_almacen(almacen, 2 ** 63 - 1, 1, "auto")
+    assert almacen.total() == 1
+    almacen.cerrar()
+
+
+def test_pool_tras_fork_con_hilos_concurrentes(tmp_path):
+    """Tras un fork, hilos simultáneos comparten un único pool acotado."""
+    n = 32
+    almacen = AlmacenResultados(_ruta_temporal(tmp_path), tamano_pool=2)
+    almacen._pid = None  # Simula el primer uso en un proceso hijo
+    barrera = threading.Barrier(n)
+
+    def peticion(i):
+        barrera.wait()
+        compensacion_con_almacen(almacen, i, 25, "auto")
+
+    hilos = [threading.Thread(target=peticion, args=(i,)) for i in range(n)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert almacen.conexiones_abiertas() <= 2
+    # Todas las conexiones creadas han vuelto al pool vigente
+    assert almacen._libres.qsize() == almacen.conexiones_abiertas()
+    assert almacen.total() == n
+    almacen.cerrar()
+
+
+if __name__ == "__main__":
+    for prueba in (test_guardar_y_obtener,
+                   test_persistencia_entre_instancias,
+                   test_precalentar_y_podar,
+                   test_ttl,
+                   test_pool_acotado_con_muchos_hilos,
+                   test_poda_automatica_al_escribir,
+                   test_operandos_fuera_de_rango_sqlite,
+                   test_pool_tras_fork_con_hilos_concurrentes):
+        with tempfile.TemporaryDirectory() as directorio:
+            prueba(pathlib.Path(directorio))
+    print("✅ Todas las pruebas del almacén pasaron")
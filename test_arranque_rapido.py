@@ -0,0 +1,95 @@
+"""
+Script de prueba para el punto de entrada ligero.
+Verifica que no carga dependencias web y que la CLI valida la entrada.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import arranque_rapido
+from suma_algoritmos import compensacion_base10_suma
+
+
+def test_importar_no_carga_dependencias_web():
+    """Importar arranque_rapido no carga flask, flask_cors ni orjson."""
+    codigo = (
+        "import sys, arranque_rapido; "
+        "print([m for m in ('flask', 'flask_cors', 'orjson') "
+        "if m in sys.modules])"
+    )
+    salida = subprocess.run(
+        [sys.executable, "-c", codigo],
+        cwd=os.path.dirname(os.path.abspath(arranque_rapido.__file__)),
+        capture_output=True, text=True, check=True
+    ).stdout
+    assert salida.strip() == "[]"
+
+
+def test_aplicacion_wsgi_carga_flask_en_la_primera_peticion():
+    """El callable WSGI responde y solo entonces importa Flask."""
+    codigo = """
+import io, json, sys
+import arranque_rapido
+assert 'flask' not in sys.modules
+
+estado = []
+environ = {
+    'REQUEST_METHOD': 'GET',
+    'PATH_INFO': '/api/suma/compensacion_base10/79+25',
+    'QUERY_STRING': '',
+    'SERVER_NAME': 'localhost', 'SERVER_PORT': '80',
+    'SERVER_PROTOCOL': 'HTTP/1.1',
+    'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(),
+    'wsgi.errors': sys.stderr, 'wsgi.version': (1, 0),
+    'wsgi.multithread': False, 'wsgi.multiprocess': False,
+    'wsgi.run_once': False,
+}
+cuerpo = b''.join(arranque_rapido.aplicacion(
+    environ, lambda status, cabeceras: estado.append(status)))
+assert 'flask' in sys.modules
+print(json.dumps({'status': estado[0], 'cuerpo': json.loads(cuerpo)}))
+"""
+    salida = subprocess.run(
+        [sys.executable, "-c", codigo],
+        cwd=os.path.dirname(os.path.abspath(arranque_rapido.__file__)),
+        capture_output=True, text=True, check=True
+    ).stdout
+    datos = json.loads(salida)
+    assert datos["status"] == "200 OK"
+    assert datos["cuerpo"] == compensacion_base10_suma(79, 25)
+
+
+def test_compensar_equivale_a_la_libreria():
+    """compensar() devuelve lo mismo que compensacion_base10_suma()."""
+    for a, b, nivel in [(79, 25, "auto"), (290, 603, "centena"),
+                        (30, 17, "auto"), (1887, 1455, "decena")]:
+        assert arranque_rapido.compensar(a, b, nivel) == \
+            compensacion_base10_suma(a, b, nivel)
+
+
+def test_main_salida_json(capsys):
+    """La CLI imprime el resultado como JSON."""
+    arranque_rapido.main(["79+25", "--nivel", "decena"])
+    datos = json.loads(capsys.readouterr().out)
+    assert datos == compensacion_base10_suma(79, 25, "decena")
+
+
+def test_main_entrada_invalida():
+    """La CLI rechaza operaciones mal formadas con código 2."""
+    for argv in (["79"], ["abc+1"], ["1+2+3"], ["79+25", "--nivel", "x"]):
+        resultado = subprocess.run(
+            [sys.executable, arranque_rapido.__file__] + argv,
+            capture_output=True, text=True
+        )
+        assert resultado.returncode == 2, argv
+        assert "error" in resultado.stderr
+
+
+if __name__ == "__main__":
+    test_importar_no_carga_dependencias_web()
+    test_aplicacion_wsgi_carga_flask_en_la_primera_peticion()
+    test_compensar_equivale_a_la_libreria()
+    test_main_entrada_invalida()
+    print("✅ Todas las pruebas del arranque rápido pasaron")
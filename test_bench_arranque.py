@@ -0,0 +1,63 @@
+"""
+Script de prueba para el benchmark de arranque.
+Verifica que los fallos de presupuesto y las importaciones prohibidas
+terminan con código 1.
+"""
+
+import bench_arranque
+
+
+def _codigo_salida(argv):
+    """Ejecuta main(argv) y devuelve su código de salida (0 si no sale)."""
+    try:
+        bench_arranque.main(argv)
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+def test_presupuesto_superado_falla():
+    """Un presupuesto diminuto provoca SystemExit(1)."""
+    argv = ["--repeticiones", "1", "--omitir", "api",
+            "--omitir", "arranque_rapido",
+            "--presupuesto", "suma_algoritmos=0.001"]
+    assert _codigo_salida(argv) == 1
+
+
+def test_presupuesto_holgado_pasa():
+    """Con presupuesto holgado el benchmark termina sin error."""
+    argv = ["--repeticiones", "1", "--omitir", "api",
+            "--omitir", "arranque_rapido",
+            "--presupuesto", "suma_algoritmos=100000"]
+    assert _codigo_salida(argv) == 0
+
+
+def test_modulo_prohibido_falla():
+    """Cargar un módulo prohibido falla aunque se cumpla el presupuesto."""
+    originales = bench_arranque.PROHIBIDOS
+    # suma_algoritmos importa typing, así que marcarlo como prohibido
+    # debe hacer fallar la comprobación
+    bench_arranque.PROHIBIDOS = {"suma_algoritmos": ("typing",)}
+    try:
+        argv = ["--repeticiones", "1", "--omitir", "api",
+                "--omitir", "arranque_rapido",
+                "--presupuesto", "suma_algoritmos=100000"]
+        assert _codigo_salida(argv) == 1
+    finally:
+        bench_arranque.PROHIBIDOS = originales
+
+
+def test_modulo_no_importable_falla():
+    """Un módulo que no se puede importar cuenta como fallo."""
+    argv = ["--repeticiones", "1", "--omitir", "api",
+            "--omitir", "arranque_rapido", "--omitir", "suma_algoritmos",
+            "--presupuesto", "modulo_inexistente=100000"]
+    assert _codigo_salida(argv) == 1
+
+
+if __name__ == "__main__":
+    test_presupuesto_superado_falla()
+    test_presupuesto_holgado_pasa()
+    test_modulo_prohibido_falla()
+    test_modulo_no_importable_falla()
+    print("✅ Todas las pruebas del benchmark de arranque pasaron")
@@ -0,0 +1,206 @@
+"""
+Script de prueba para la coalescencia de peticiones concurrentes.
+Verifica que una ráfaga de llamadas idénticas ejecuta un único cálculo.
+"""
+
+import threading
+import time
+
+import api
+from coalescencia import Coalescedor, ErrorCalculoCompartido
+from suma_algoritmos import compensacion_base10_suma
+
+
+def _rafaga(coalescedor, clave, funcion, n):
+    """Lanza n hilos a la vez con la misma clave y devuelve sus resultados."""
+    resultados = [None] * n
+    errores = []
+    barrera = threading.Barrier(n)
+
+    def trabajador(i):
+        barrera.wait()
+        try:
+            resultados[i] = coalescedor.ejecutar(clave, funcion)
+        except Exception as e:
+            errores.append(e)
+
+    hilos = [threading.Thread(target=trabajador, args=(i,))
+             for i in range(n)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return resultados, errores
+
+
+def _esperar_coalescidas(coalescedor, esperadas, limite=5.0):
+    """Bloquea hasta que `esperadas` llamadas estén esperando al líder."""
+    fin = time.monotonic() + limite
+    while coalescedor.metricas()["coalescidas"] < esperadas:
+        assert time.monotonic() < fin, "Las llamadas no se coalescieron"
+        time.sleep(0.001)
+
+
+def test_un_calculo_por_rafaga():
+    """100 llamadas idénticas simultáneas producen un único cálculo."""
+    n = 100
+    coalescedor = Coalescedor()
+    llamadas = []
+
+    def calcular():
+        llamadas.append(1)
+        # Mantener el cálculo en vuelo hasta que lleguen todas las demás
+        _esperar_coalescidas(coalescedor, n - 1)
+        return compensacion_base10_suma(79, 25)
+
+    resultados, errores = _rafaga(coalescedor, ("/79+25", "auto"),
+                                  calcular, n)
+
+    assert not errores
+    assert len(llamadas) == 1
+    assert all(r is resultados[0] for r in resultados)
+    assert coalescedor.metricas() == {
+        "ejecuciones": 1, "coalescidas": n - 1, "en_vuelo": 0
+    }
+
+
+def test_claves_distintas_no_se_coalescen():
+    """Cada clave distinta ejecuta su propio cálculo."""
+    coalescedor = Coalescedor()
+    coalescedor.ejecutar(("/79+25", "auto"), lambda: 1)
+    coalescedor.ejecutar(("/79+25", "decena"), lambda: 2)
+    assert coalescedor.metricas()["ejecuciones"] == 2
+    assert coalescedor.metricas()["coalescidas"] == 0
+
+
+def test_error_se_propaga_a_todos():
+    """Si el cálculo falla, todas las llamadas de la ráfaga reciben el error."""
+    n = 10
+    coalescedor = Coalescedor()
+
+    def fallar():
+        _esperar_coalescidas(coalescedor, n - 1)
+        raise ValueError("fallo")
+
+    resultados, errores = _rafaga(coalescedor, "clave", fallar, n)
+    assert len(errores) == n
+    assert all(isinstance(e, ValueError) for e in errores)
+
+    # Cada llamada recibe su propia instancia, encadenada a la original
+    assert len({id(e) for e in errores}) == n
+    originales = {id(e.__cause__) for e in errores if e.__cause__}
+    assert len(originales) == 1
+
+    # La clave queda libre para un nuevo cálculo
+    assert coalescedor.ejecutar("clave", lambda: 42) == 42
+
+
+class _ErrorConArgumentoNombrado(Exception):
+    """Excepción que `copy.copy` no puede reconstruir con sus args."""
+
+    def __init__(self, mensaje, *, codigo):
+        super().__init__(mensaje)
+        self.codigo = codigo
+
+
+def test_error_no_copiable_se_envuelve():
+    """Si la excepción no se puede copiar, las esperas reciben un envoltorio."""
+    n = 5
+    coalescedor = Coalescedor()
+
+    def fallar():
+        _esperar_coalescidas(coalescedor, n - 1)
+        raise _ErrorConArgumentoNombrado("fallo", codigo=7)
+
+    resultados, errores = _rafaga(coalescedor, "clave", fallar, n)
+    lider = [e for e in errores if isinstance(e, _ErrorConArgumentoNombrado)]
+    envueltos = [e for e in errores
+                 if isinstance(e, ErrorCalculoCompartido)]
+    assert len(lider) == 1
+    assert len(envueltos) == n - 1
+    assert all(e.__cause__ is lider[0] for e in envueltos)
+    assert all(str(e) == "fallo" for e in envueltos)
+
+
+def test_interrupcion_del_lider_no_se_propaga():
+    """Un KeyboardInterrupt del líder no se relanza en las demás llamadas."""
+    n = 5
+    coalescedor = Coalescedor()
+    interrumpidos = []
+
+    def interrumpir():
+        _esperar_coalescidas(coalescedor, n - 1)
+        raise KeyboardInterrupt
+
+    def lider():
+        try:
+            coalescedor.ejecutar("clave", interrumpir)
+        except KeyboardInterrupt:
+            interrumpidos.append(1)
+
+    hilo = threading.Thread(target=lider)
+    hilo.start()
+    while coalescedor.metricas()["en_vuelo"] == 0:
+        time.sleep(0.001)
+
+    resultados, errores = _rafaga(coalescedor, "clave", lambda: 0, n - 1)
+    hilo.join()
+
+    assert interrumpidos == [1]
+    assert len(errores) == n - 1
+    assert all(isinstance(e, ErrorCalculoCompartido) for e in errores)
+
+
+def test_api_un_calculo_por_rafaga():
+    """N GET idénticos simultáneos a la API ejecutan un único cálculo."""
+    n = 20
+    url = "/api/suma/compensacion_base10/79+25?nivel=decena"
+    llamadas = []
+    original = api.calcular_compensacion
+    antes = api.coalescedor.metricas()
+
+    def calcular(a, b, nivel="auto"):
+        llamadas.append((a, b, nivel))
+        _esperar_coalescidas(api.coalescedor, antes["coalescidas"] + n - 1)
+        return original(a, b, nivel)
+
+    respuestas = [None] * n
+    barrera = threading.Barrier(n)
+
+    def trabajador(i):
+        cliente = api.app.test_client()
+        barrera.wait()
+        respuestas[i] = cliente.get(url)
+
+    api.calcular_compensacion = calcular
+    try:
+        hilos = [threading.Thread(target=trabajador, args=(i,))
+                 for i in range(n)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+    finally:
+        api.calcular_compensacion = original
+
+    assert llamadas == [(79, 25, "decena")]
+    assert all(r.status_code == 200 for r in respuestas)
+    assert len({r.get_data() for r in respuestas}) == 1
+    assert respuestas[0].get_json()["resultado_final"] == 104
+
+    metricas = api.app.test_client().get("/api/metricas/coalescencia")
+    assert metricas.status_code == 200
+    datos = metricas.get_json()
+    assert datos["ejecuciones"] == antes["ejecuciones"] + 1
+    assert datos["coalescidas"] == antes["coalescidas"] + n - 1
+    assert datos["en_vuelo"] == 0
+
+
+if __name__ == "__main__":
+    test_un_calculo_por_rafaga()
+    test_claves_distintas_no_se_coalescen()
+    test_error_se_propaga_a_todos()
+    test_error_no_copiable_se_envuelve()
+    test_interrupcion_del_lider_no_se_propaga()
+    test_api_un_calculo_por_rafaga()
+    print("✅ Todas las pruebas de coalescencia pasaron")
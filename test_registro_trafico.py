@@ -0,0 +1,56 @@
+"""
+Script de prueba para el registro de tráfico de la API.
+Instala el registrador en la app, hace peticiones con el cliente de pruebas
+de Flask y verifica las líneas JSON escritas.
+"""
+
+import importlib
+import json
+import os
+import pathlib
+import tempfile
+
+import api
+from reproducir_trafico import cargar_registros
+
+
+def _app_con_registro(ruta):
+    """Recarga `api` con REGISTRO_TRAFICO activado y devuelve la app."""
+    os.environ["REGISTRO_TRAFICO"] = ruta
+    try:
+        return importlib.reload(api).app
+    finally:
+        del os.environ["REGISTRO_TRAFICO"]
+
+
+def test_registro_de_peticiones(tmp_path):
+    """Cada petición genera un registro con ruta, operandos, nivel y status."""
+    ruta = str(tmp_path / "trafico.log")
+    try:
+        cliente = _app_con_registro(ruta).test_client()
+        cliente.get("/api/suma/compensacion_base10/79+25?nivel=decena")
+        cliente.get("/api/suma/compensacion_base10/abc+1")
+        cliente.get("/api/no_existe")
+    finally:
+        importlib.reload(api)
+
+    # Un fichero por proceso
+    fichero = f"{ruta}.{os.getpid()}"
+    with open(fichero, encoding="utf-8") as f:
+        registros = [json.loads(linea) for linea in f]
+
+    regla = "/api/suma/compensacion_base10/<operacion>"
+    assert [r["r"] for r in registros] == [regla, regla, "/api/no_existe"]
+    assert [r["op"] for r in registros] == ["79+25", "abc+1", None]
+    assert [r["n"] for r in registros] == ["decena", None, None]
+    assert [r["s"] for r in registros] == [200, 400, 404]
+    assert all(r["ms"] >= 0 and r["t"] > 0 for r in registros)
+
+    # La reproducción encuentra los ficheros por proceso
+    assert cargar_registros(ruta) == registros
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directorio:
+        test_registro_de_peticiones(pathlib.Path(directorio))
+    print("✅ Todas las pruebas del registro de tráfico pasaron")
@@ -0,0 +1,119 @@
+"""
+Script de prueba para la reproducción de tráfico grabado.
+Verifica la lectura de logs rotados, la reconstrucción de URLs y el informe.
+"""
+
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import time
+
+from reproducir_trafico import (
+    cargar_registros, construir_url, percentil, reproducir
+)
+
+
+def _registro(t, op="79+25", nivel=None, status=200):
+    return {"t": t, "r": "/api/suma/compensacion_base10/<operacion>",
+            "op": op, "n": nivel, "ms": 1.0, "s": status}
+
+
+def test_cargar_registros_rotados(tmp_path):
+    """Se leen los ficheros de cada proceso y sus copias rotadas."""
+    ruta = str(tmp_path / "trafico.log")
+    for sufijo, t in ((".101", 3.0), (".101.1", 1.0), (".202", 2.0)):
+        with open(ruta + sufijo, "w") as f:
+            f.write(json.dumps(_registro(t)) + "\n")
+    with open(ruta + ".bak", "w") as f:
+        f.write("no es un log\n")
+
+    registros = cargar_registros(ruta)
+    assert [r["t"] for r in registros] == [1.0, 2.0, 3.0]
+
+
+def test_construir_url():
+    """La URL se reconstruye con operandos y nivel."""
+    assert construir_url(_registro(0)) == \
+        "/api/suma/compensacion_base10/79+25"
+    assert construir_url(_registro(0, nivel="decena")) == \
+        "/api/suma/compensacion_base10/79+25?nivel=decena"
+
+
+def test_percentil():
+    """Percentiles por rango más cercano."""
+    valores = list(range(1, 101))
+    assert percentil(valores, 50) == 50
+    assert percentil(valores, 99) == 99
+    assert percentil([], 50) == 0.0
+
+    # Tamaños donde redondear a par daría un rango demasiado bajo
+    assert percentil([1, 2, 3, 4, 5], 50) == 3
+    assert percentil(list(range(1, 151)), 99) == 149
+
+
+def test_reproducir_cuenta_errores():
+    """Las respuestas 5xx y las excepciones cuentan como errores."""
+    respuestas = iter([200, 500, None])
+
+    def ejecutar(url):
+        status = next(respuestas)
+        if status is None:
+            raise ConnectionError
+        return status
+
+    registros = [_registro(t / 1000) for t in range(3)]
+    resultado = reproducir(registros, ejecutar, velocidad=100, hilos=1)
+    datos = resultado["rutas"]["/api/suma/compensacion_base10/<operacion>"]
+    assert len(datos["latencias"]) == 3
+    assert datos["errores"] == 2
+
+
+def test_latencia_incluye_espera_en_cola():
+    """Con los hilos saturados, la espera en cola cuenta como latencia."""
+    def ejecutar(url):
+        time.sleep(0.02)
+        return 200
+
+    # 5 peticiones programadas a la vez con un único hilo
+    registros = [_registro(0.0) for _ in range(5)]
+    resultado = reproducir(registros, ejecutar, velocidad=1, hilos=1)
+    latencias = sorted(
+        resultado["rutas"]["/api/suma/compensacion_base10/<operacion>"]
+        ["latencias"]
+    )
+
+    # La última espera a las 4 anteriores (~80 ms) antes de ejecutarse
+    assert latencias[-1] >= 90
+    assert max(resultado["retrasos"]) >= 70
+
+
+def test_cliente_flask_no_graba_la_reproduccion(tmp_path):
+    """Con REGISTRO_TRAFICO activo, la reproducción no escribe en el log."""
+    codigo = (
+        "import reproducir_trafico as r; "
+        "ejecutar = r._peticion_cliente_flask(); "
+        "print(ejecutar('/api/health'))"
+    )
+    entorno = dict(os.environ, REGISTRO_TRAFICO=str(tmp_path / "t.log"))
+    salida = subprocess.run(
+        [sys.executable, "-c", codigo], env=entorno,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    ).stdout
+    assert salida.strip() == "200"
+    assert list(tmp_path.iterdir()) == []
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directorio:
+        test_cargar_registros_rotados(pathlib.Path(directorio))
+    test_construir_url()
+    test_percentil()
+    test_reproducir_cuenta_errores()
+    test_latencia_incluye_espera_en_cola()
+    with tempfile.TemporaryDirectory() as directorio:
+        test_cliente_flask_no_graba_la_reproduccion(pathlib.Path(directorio))
+    print("✅ Todas las pruebas de reproducción pasaron")